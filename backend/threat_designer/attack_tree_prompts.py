@@ -6,10 +6,13 @@ The prompts guide the LLM agent to generate comprehensive attack trees using MIT
 framework and ReACT pattern.
 """
 
+import functools
 import os
 from langchain_core.messages import SystemMessage, HumanMessage
 from typing import Optional
 
+from message_builder import _CACHE_POINT, _normalize_instructions
+
 # Import model provider from config
 try:
     from config import config
@@ -24,8 +27,14 @@ def create_attack_tree_system_prompt(
 ) -> SystemMessage:
     """
     Create system prompt for attack tree generation agent.
+
+    The content is memoized per instructions value; a fresh SystemMessage is
+    returned on every call because LangGraph assigns message ids in place.
     """
-    main_prompt = """
+    return SystemMessage(content=_attack_tree_system_content(instructions))
+
+
+_ATTACK_TREE_SYSTEM_PROMPT = """
 <role>
 You are an expert security analyst specializing in attack tree generation and threat analysis. You create comprehensive, realistic attack trees that map potential attack paths for identified security threats, aligned with the MITRE ATT&CK framework.
 </role>
@@ -157,26 +166,39 @@ Actionability: every technique should be detectable or preventable by defenders.
 </quality_criteria>
 """
 
+
+@functools.lru_cache(maxsize=16)
+def _attack_tree_system_content(instructions: Optional[str] = None):
+    """Build the attack tree system prompt content for the active provider."""
     if instructions:
-        instructions_prompt = f"""
-<custom_instructions>
-{instructions}
-</custom_instructions>
-"""
-        final_prompt = main_prompt + instructions_prompt
+        final_prompt = "".join(
+            (
+                _ATTACK_TREE_SYSTEM_PROMPT,
+                "\n<custom_instructions>\n",
+                _normalize_instructions(instructions),
+                "\n</custom_instructions>\n",
+            )
+        )
     else:
-        final_prompt = main_prompt
+        final_prompt = _ATTACK_TREE_SYSTEM_PROMPT
 
-    # Build content with conditional cache points (Bedrock only)
-    # For OpenAI, caching is handled automatically
-    if MODEL_PROVIDER == "bedrock":
-        content = [
-            {"type": "text", "text": final_prompt},
-            {"cachePoint": {"type": "default"}},
-        ]
-        return SystemMessage(content=content)
-    else:
-        return SystemMessage(content=final_prompt)
+    return _system_content(final_prompt)
+
+
+def _bedrock_system_content(prompt: str) -> list:
+    """Wrap the prompt in a text block followed by a Bedrock cache point."""
+    return [{"type": "text", "text": prompt}, _CACHE_POINT]
+
+
+def _openai_system_content(prompt: str) -> str:
+    """Return the prompt as-is; OpenAI handles prompt caching automatically."""
+    return prompt
+
+
+# The provider is fixed for the process, so pick the content shape once.
+_system_content = (
+    _bedrock_system_content if MODEL_PROVIDER == "bedrock" else _openai_system_content
+)
 
 
 def create_attack_tree_human_message(
@@ -291,12 +313,12 @@ Start by reasoning about the threat and planning your approach, then use the ava
                     },
                 },
                 {"type": "text", "text": message_text},
-                {"cachePoint": {"type": "default"}},
+                _CACHE_POINT,
             ]
         else:
             message_content = [
                 {"type": "text", "text": message_text},
-                {"cachePoint": {"type": "default"}},
+                _CACHE_POINT,
             ]
     else:
         # OpenAI: caching is automatic, use simple format
@@ -1,6 +1,7 @@
 """Message building utilities for model interactions."""
 
 import os
+import re
 from typing import Any, Dict, List
 
 from langchain_core.messages import SystemMessage
@@ -75,6 +76,24 @@ def inject_bedrock_cache_points(messages: list) -> list:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Prompt text helpers
+# ---------------------------------------------------------------------------
+
+_BLANK_LINE_RUN = re.compile(r"\n{3,}")
+
+
+def _normalize_instructions(instructions: str) -> str:
+    """Canonicalize line endings and whitespace in user-supplied instructions.
+
+    Semantically identical instructions then render byte-identical prompts,
+    which keeps provider prompt caches warm across iterations. Every prompt
+    module that embeds instructions runs them through this helper.
+    """
+    text = "\n".join(line.rstrip() for line in instructions.splitlines())
+    return _BLANK_LINE_RUN.sub("\n\n", text).strip()
+
+
 class MessageBuilder:
     """Utility class for building standardized messages."""
 
@@ -120,30 +139,24 @@ class MessageBuilder:
 
     def _format_asset_list(self, assets) -> str:
         """Helper function to format asset names as plain comma-separated quoted strings."""
-        if not assets or not hasattr(assets, "assets") or not assets.assets:
+        asset_list = getattr(assets, "assets", None)
+        if not asset_list:
             return "No assets identified yet."
 
-        asset_names = [asset.name for asset in assets.assets]
-        return ", ".join([f'"{name}"' for name in asset_names])
+        return ", ".join([f'"{asset.name}"' for asset in asset_list])
 
     def _format_threat_sources(self, system_architecture) -> str:
         """Helper function to format threat source categories as plain comma-separated quoted strings."""
-        if (
-            not system_architecture
-            or not hasattr(system_architecture, "threat_sources")
-            or not system_architecture.threat_sources
-        ):
+        threat_sources = getattr(system_architecture, "threat_sources", None)
+        if not threat_sources:
             return "No threat sources identified yet."
 
-        source_categories = [
-            source.category for source in system_architecture.threat_sources
-        ]
-        return ", ".join([f'"{category}"' for category in source_categories])
+        return ", ".join([f'"{source.category}"' for source in threat_sources])
 
     def _add_cache_point_if_bedrock(self) -> List[Dict[str, Any]]:
         """Add cache point marker only for Bedrock provider."""
         if self.provider == MODEL_PROVIDER_BEDROCK:
-            return [{"cachePoint": {"type": "default"}}]
+            return [_CACHE_POINT]
         return []
 
     def _build_valid_values_block(self, assets, system_architecture) -> str:
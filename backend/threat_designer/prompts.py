@@ -10,9 +10,12 @@ Each function generates specialized prompts for different phases of the threat m
 - Response structuring
 """
 
+import functools
 import os
 from langchain_core.messages import SystemMessage
 
+from message_builder import _CACHE_POINT, _normalize_instructions
+
 # Import model provider from config
 try:
     from config import config
@@ -44,17 +47,39 @@ APPLICATION_TYPE_DESCRIPTIONS = {
 }
 
 
-def _get_application_type_context(application_type: str = "hybrid") -> str:
+# Fallback for unknown application types; fails at import if "hybrid" is missing.
+_HYBRID_DESCRIPTION = APPLICATION_TYPE_DESCRIPTIONS["hybrid"]
+
+
+def _render_application_type_context(application_type: str) -> str:
     """Return an XML-wrapped application type context block for injection into prompts."""
-    description = APPLICATION_TYPE_DESCRIPTIONS.get(
-        application_type, APPLICATION_TYPE_DESCRIPTIONS["hybrid"]
-    )
+    description = APPLICATION_TYPE_DESCRIPTIONS.get(application_type)
+    if description is None:
+        description = _HYBRID_DESCRIPTION
     return f"\n<application_type>\nApplication Type: {application_type}\n{description}\n</application_type>\n"
 
 
-def _get_asset_criticality_context() -> str:
-    """Return an XML-wrapped asset criticality definitions block for injection into prompts."""
-    return """
+# Rendered once at import — the known application types never change.
+_APP_TYPE_CONTEXTS = {
+    app_type: _render_application_type_context(app_type)
+    for app_type in APPLICATION_TYPE_DESCRIPTIONS
+}
+
+
+def _get_application_type_context(application_type: str = "hybrid") -> str:
+    """Return the application type context block, rendering unknown types on demand.
+
+    Unknown types keep their own label with the hybrid description, matching
+    prompts_gpt.py.
+    """
+    context = _APP_TYPE_CONTEXTS.get(application_type)
+    if context is None:
+        context = _render_application_type_context(application_type)
+    return context
+
+
+# XML-wrapped asset criticality definitions block for injection into prompts.
+_ASSET_CRITICALITY_CONTEXT = """
 <asset_criticality>
 Assets and entities have a criticality level that reflects their risk profile:
 
@@ -71,17 +96,64 @@ For Entities (users, roles, external systems, services) — based on privilege l
 """
 
 
-def summary_prompt() -> str:
-    main_prompt = """<instruction>
+def _get_instructions_context(instructions: str) -> str:
+    """Return an XML-wrapped block carrying user-supplied instructions."""
+    return (
+        "\n<important_instructions>\n"
+        f"{_normalize_instructions(instructions)}"
+        "\n</important_instructions>\n"
+    )
+
+
+def _build_prompt_blocks(static_parts: list, dynamic_parts: list = ()) -> list:
+    """Assemble prompt content blocks ordered from most to least stable.
+
+    Static parts come first so providers can reuse the cached prefix across
+    calls. On Bedrock a single cache point closes the static prefix and dynamic
+    parts follow it, so changing them never invalidates the cached blocks. A
+    single cache point is used because human messages already carry up to two
+    and Bedrock allows at most four per request.
+
+    Prompt builders memoize the returned list, so callers must treat it as
+    read-only.
+    """
+    blocks = [{"type": "text", "text": part} for part in static_parts]
+    blocks.extend(_STATIC_PREFIX_END)
+    blocks.extend({"type": "text", "text": part} for part in dynamic_parts if part)
+    return blocks
+
+
+def _bedrock_content_from_parts(parts: list) -> list:
+    """Return agent system content as text blocks closed by a cache point."""
+    return _build_prompt_blocks(parts)
+
+
+def _openai_content_from_parts(parts: list) -> str:
+    """Return agent system content as one string; OpenAI caches automatically."""
+    return "".join(parts)
+
+
+# Both picked from MODEL_PROVIDER at import.
+_STATIC_PREFIX_END = [_CACHE_POINT] if MODEL_PROVIDER == "bedrock" else []
+_content_from_parts = (
+    _bedrock_content_from_parts
+    if MODEL_PROVIDER == "bedrock"
+    else _openai_content_from_parts
+)
+
+
+_SUMMARY_PROMPT = """<instruction>
    Use the information provided by the user to generate a short headline summary of max {SUMMARY_MAX_WORDS_DEFAULT} words.
    </instruction> \n
       """
-    return [{"type": "text", "text": main_prompt}]
 
 
-def asset_prompt(application_type: str = "hybrid") -> str:
-    app_type_context = _get_application_type_context(application_type)
-    main_prompt = """<role>
+@functools.lru_cache(maxsize=1)
+def summary_prompt() -> list:
+    return [{"type": "text", "text": _SUMMARY_PROMPT}]
+
+
+_ASSET_MAIN_PROMPT = """<role>
 You are a security architect specializing in threat modeling. You identify
 critical assets and entities within system architectures that require
 protection, producing structured inventories used as input for downstream
@@ -96,37 +168,6 @@ Each asset or entity you identify will be evaluated for threats,
 vulnerabilities, and mitigations.
 </context>
 
-<criticality_criteria>
-Assign a criticality level to each item using the criteria appropriate to its
-type:
-
-For Assets (data stores, APIs, keys, configs, logs):
-- Low: Handles non-sensitive operational data with minimal business impact if
-  compromised (e.g., system telemetry, public documentation, non-critical
-  caches).
-- Medium: Handles internal or moderately sensitive data whose compromise would
-  cause noticeable but contained business impact (e.g., internal APIs,
-  application logs with limited sensitive content, non-public configuration).
-- High: Handles sensitive, regulated, or business-critical data such as PII,
-  financial records, authentication credentials, encryption keys, or data
-  subject to regulatory frameworks (e.g., GDPR, HIPAA, PCI-DSS).
-
-For Entities (users, roles, external systems, services):
-- Low: Limited access scope with minimal privilege. Compromise has narrow blast
-  radius and low impact on other components (e.g., read-only monitoring
-  service, public-facing anonymous user).
-- Medium: Moderate access or privilege within the system. Compromise could
-  affect multiple components or expose internal functionality (e.g., standard
-  application user, internal microservice with cross-service access).
-- High: Elevated privilege, broad trust scope, or crosses a critical trust
-  boundary. Compromise could lead to widespread unauthorized access, lateral
-  movement, or full system takeover (e.g., admin user, CI/CD pipeline service
-  account, external payment gateway with write access).
-
-When you cannot confidently determine the appropriate criticality level,
-default to Medium.
-</criticality_criteria>
-
 <instructions>
 Review all three inputs together, then identify assets and entities.
 
@@ -142,7 +183,8 @@ the system.
 For each item, classify it as either "Asset" or "Entity," give it a clear name,
 and write a one-to-two sentence description explaining what it is and why it
 matters to the system's security posture. Assign a criticality level using the
-criteria in the section above.
+asset_criticality definitions provided below. When you cannot confidently
+determine the appropriate criticality level, default to Medium.
 </instructions>
 
 <inputs>
@@ -165,122 +207,125 @@ Group all Assets first, then all Entities. Order each group by criticality,
 with the most critical items listed first.
 </output_format>
 """
-    return [{"type": "text", "text": app_type_context + main_prompt}]
 
 
-def gap_prompt(instructions: str = None, application_type: str = "hybrid") -> str:
+@functools.lru_cache(maxsize=32)
+def asset_prompt(application_type: str = "hybrid") -> list:
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
-    main_prompt = """
-        <role>
-    You audit threat catalogs against a specific architecture and decide STOP
-    (catalog is production-ready) or CONTINUE (gaps remain). A CONTINUE sends the
-    generating agent back, so your findings must be specific enough to act on.
-    This prompt may be called multiple times — each iteration evaluates whether
-    previous gaps were addressed and whether new ones emerged.
-    </role>
-
-    <inputs>
-    {{ARCHITECTURE_DESCRIPTION}} — system design, components, data flows, and
-    assumptions. Assumptions define what the architecture takes as given and are
-    not attack surface. A threat contradicting a stated assumption is a compliance
-    violation. Threats targeting the controls *upholding* an assumption (e.g.,
-    compromising the CA behind mTLS) are legitimate.
-
-    {{THREAT_CATALOG_KPIS}} — STRIDE distribution, counts, likelihood ratings.
-
-    {{CURRENT_THREAT_CATALOG}} — the threats to review.
-    </inputs>
-
-    <analysis_areas>
-    Evaluate three areas. A meaningful failure in any area means CONTINUE.
-
-    Compliance:
-    Hallucinated components — threats referencing services, data flows, or
-    infrastructure absent from the architecture. Assumption breaches — threats
-    contradicting stated trust boundaries or deployment constraints. A single
-    hallucinated component indicates the generating agent has an incorrect model
-    of the system.
-
-    Coverage:
-    Logic flaws (race conditions, state inconsistencies, quota bypasses) plausible
-    for the design. Incomplete attack chains where a threat assumes an
-    unestablished precondition. Technology-specific vulnerabilities tied to the
-    described languages, frameworks, or services. Underrepresented STRIDE
-    categories relative to what the design exposes — e.g., an API-heavy system
-    with few spoofing or repudiation threats. Judge what's actually missing versus
-    reasonably out of scope.
-
-    Calibration:
-    Severity distribution must be proportionate to real-world exposure. A public-
-    facing system handling PII or financial data should have meaningful high-
-    likelihood, high-impact threats — these systems face constant automated attack.
-    A low-criticality internal tool with mostly medium/low findings may be
-    perfectly calibrated. Test: would an experienced security engineer trust this
-    distribution, or flag it as underscoped?
-    </analysis_areas>
-
-    <decision_criteria>
-    STOP: zero compliance violations, reasonable STRIDE coverage across critical
-    components, severity distribution proportionate to exposure.
-
-    CONTINUE: compliance violations exist, concrete attack vectors are missing, or
-    severity doesn't match system criticality. Priority actions must be specific
-    and actionable.
-
-    Commit to your decision. Minor calibration quibbles are a STOP — reserve
-    CONTINUE for findings that would materially change the catalog's usefulness.
-    </decision_criteria>
-
-    <output_format>
-    Your output is consumed by a structured extraction layer. Think through your
-    analysis fully, then populate the tool schema fields:
-
-    stop: true if catalog is production-ready, false if gaps remain.
-    gaps: list of specific gap findings (only when stop=false). Each gap must have:
-      - target: exact asset name from the architecture
-      - stride_category: the STRIDE category that is missing or weak
-      - severity: CRITICAL (no coverage on high-criticality asset), MAJOR (weak
-        coverage), or MINOR (calibration/quality issue)
-      - description: imperative, actionable, max 40 words — what is missing and
-        why it matters
-    rating: 1-10 quality score for the catalog.
-
-    Focus gaps on the highest-value findings. Do not list more than 10 gaps.
-    Every gap must reference a real asset from the architecture and a specific
-    STRIDE category — no generic "improve coverage" findings.
-
-    Attack chains: when you identify that a threat assumes an unestablished
-    precondition (e.g., "attacker has DB credentials" but no credential-theft
-    threat exists), flag the missing precondition threat as a gap.
-    </output_format>
-    """
+    return _build_prompt_blocks(
+        [_ASSET_MAIN_PROMPT, _ASSET_CRITICALITY_CONTEXT, app_type_context]
+    )
 
-    if instructions:
-        instructions_prompt = f"""\n<important_instructions>
-         {instructions}
-         </important_instructions>
-      """
-        final_prompt = (
-            instructions_prompt + app_type_context + criticality_context + main_prompt
-        )
-    else:
-        final_prompt = app_type_context + criticality_context + main_prompt
 
-    return [{"type": "text", "text": final_prompt}]
+_GAP_INSTRUCTIONS = """
+<role>
+You audit threat catalogs against a specific architecture and decide STOP
+(catalog is production-ready) or CONTINUE (gaps remain). A CONTINUE sends the
+generating agent back, so your findings must be specific enough to act on.
+This prompt may be called multiple times — each iteration evaluates whether
+previous gaps were addressed and whether new ones emerged.
+</role>
 
+<inputs>
+{{ARCHITECTURE_DESCRIPTION}} — system design, components, data flows, and
+assumptions. Assumptions define what the architecture takes as given and are
+not attack surface. A threat contradicting a stated assumption is a compliance
+violation. Threats targeting the controls *upholding* an assumption (e.g.,
+compromising the CA behind mTLS) are legitimate.
 
-def threats_improve_prompt(
-    instructions: str = None, application_type: str = "hybrid"
-) -> str:
+{{THREAT_CATALOG_KPIS}} — STRIDE distribution, counts, likelihood ratings.
+
+{{CURRENT_THREAT_CATALOG}} — the threats to review.
+</inputs>
+
+<analysis_areas>
+Evaluate three areas. A meaningful failure in any area means CONTINUE.
+
+Compliance:
+Hallucinated components — threats referencing services, data flows, or
+infrastructure absent from the architecture. Assumption breaches — threats
+contradicting stated trust boundaries or deployment constraints. A single
+hallucinated component indicates the generating agent has an incorrect model
+of the system.
+
+Coverage:
+Logic flaws (race conditions, state inconsistencies, quota bypasses) plausible
+for the design. Incomplete attack chains where a threat assumes an
+unestablished precondition. Technology-specific vulnerabilities tied to the
+described languages, frameworks, or services. Underrepresented STRIDE
+categories relative to what the design exposes — e.g., an API-heavy system
+with few spoofing or repudiation threats. Judge what's actually missing versus
+reasonably out of scope.
+
+Calibration:
+Severity distribution must be proportionate to real-world exposure. A public-
+facing system handling PII or financial data should have meaningful high-
+likelihood, high-impact threats — these systems face constant automated attack.
+A low-criticality internal tool with mostly medium/low findings may be
+perfectly calibrated. Test: would an experienced security engineer trust this
+distribution, or flag it as underscoped?
+</analysis_areas>
+
+<decision_criteria>
+STOP: zero compliance violations, reasonable STRIDE coverage across critical
+components, severity distribution proportionate to exposure.
+
+CONTINUE: compliance violations exist, concrete attack vectors are missing, or
+severity doesn't match system criticality. Priority actions must be specific
+and actionable.
+
+Commit to your decision. Minor calibration quibbles are a STOP — reserve
+CONTINUE for findings that would materially change the catalog's usefulness.
+</decision_criteria>
+
+"""
+
+_GAP_OUTPUT_FORMAT = """<output_format>
+Your output is consumed by a structured extraction layer. Think through your
+analysis fully, then populate the tool schema fields:
+
+stop: true if catalog is production-ready, false if gaps remain.
+gaps: list of specific gap findings (only when stop=false). Each gap must have:
+  - target: exact asset name from the architecture
+  - stride_category: the STRIDE category that is missing or weak
+  - severity: CRITICAL (no coverage on high-criticality asset), MAJOR (weak
+    coverage), or MINOR (calibration/quality issue)
+  - description: imperative, actionable, max 40 words — what is missing and
+    why it matters
+rating: 1-10 quality score for the catalog.
+
+Focus gaps on the highest-value findings. Do not list more than 10 gaps.
+Every gap must reference a real asset from the architecture and a specific
+STRIDE category — no generic "improve coverage" findings.
+
+Attack chains: when you identify that a threat assumes an unestablished
+precondition (e.g., "attacker has DB credentials" but no credential-theft
+threat exists), flag the missing precondition threat as a gap.
+</output_format>
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def gap_prompt(instructions: str = None, application_type: str = "hybrid") -> list:
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
-    main_prompt = """<role>
+    dynamic_parts = [_get_instructions_context(instructions)] if instructions else []
+    return _build_prompt_blocks(
+        [
+            _GAP_INSTRUCTIONS,
+            _GAP_OUTPUT_FORMAT,
+            _ASSET_CRITICALITY_CONTEXT,
+            app_type_context,
+        ],
+        dynamic_parts,
+    )
+
+
+_THREATS_INSTRUCTIONS = """<role>
 You are a security architect generating threat entries for a system architecture using the STRIDE methodology. You produce structured JSON threat objects that feed into a threat catalog reviewed by a downstream gap analysis agent. Precision in field values and realistic severity calibration matter more than volume.
 </role>
 
 <context>
-Threat catalogs produced by automated generation commonly suffer from two problems: optimism bias, where public-facing and sensitive components receive underscored severity ratings, and vague mitigations that provide no actionable guidance. Your output must avoid both.
+Avoid the two common failures of generated catalogs: optimism bias, where public-facing and sensitive components receive underscored severity ratings, and vague mitigations that provide no actionable guidance.
 
 This prompt may be called iteratively. If an existing threat catalog is provided, you are generating additional threats to fill identified gaps. Do not duplicate threats already in the catalog.
 </context>
@@ -336,7 +381,9 @@ Ensure every STRIDE category is represented. If a category has genuinely no appl
 Prioritize generating threats for gaps identified in the gap analysis instructions when provided. After addressing those gaps, continue with any additional threats you identify.
 </instructions>
 
-<output_format>
+"""
+
+_THREATS_OUTPUT_FORMAT = """<output_format>
 Return a JSON array of threat objects. Each object must conform to this schema:
 
 {
@@ -356,37 +403,29 @@ Do not wrap the JSON in markdown code fences. Output only the JSON array.
 </output_format>
 """
 
-    instructions_prompt = f"""\n<important_instructions>
-         {instructions}
-         </important_instructions>
-      """
-
-    if instructions:
-        return [
-            {
-                "type": "text",
-                "text": instructions_prompt
-                + app_type_context
-                + criticality_context
-                + main_prompt,
-            }
-        ]
-    return [
-        {"type": "text", "text": app_type_context + criticality_context + main_prompt}
-    ]
 
+@functools.lru_cache(maxsize=32)
+def threats_improve_prompt(
+    instructions: str = None, application_type: str = "hybrid"
+) -> list:
+    app_type_context = _get_application_type_context(application_type)
+    dynamic_parts = [_get_instructions_context(instructions)] if instructions else []
+    return _build_prompt_blocks(
+        [
+            _THREATS_INSTRUCTIONS,
+            _THREATS_OUTPUT_FORMAT,
+            _ASSET_CRITICALITY_CONTEXT,
+            app_type_context,
+        ],
+        dynamic_parts,
+    )
 
-def threats_prompt(instructions: str = None, application_type: str = "hybrid") -> str:
-    return threats_improve_prompt(instructions, application_type)
 
+# Initial threat generation uses the same prompt as the improvement pass.
+threats_prompt = threats_improve_prompt
 
-def create_space_context_system_prompt() -> SystemMessage:
-    """Create system prompt for the space context knowledge base agent.
 
-    Returns:
-        SystemMessage with complete space context agent instructions
-    """
-    prompt = """You are a senior security researcher performing knowledge base reconnaissance for a threat modeling engagement. Your goal is to surface architecture-specific context — technical, regulatory, and business — that will sharpen the threat model for this system.
+_SPACE_CONTEXT_AGENT_PROMPT = """You are a senior security researcher performing knowledge base reconnaissance for a threat modeling engagement. Your goal is to surface architecture-specific context — technical, regulatory, and business — that will sharpen the threat model for this system.
 
     <context>
     You will receive an architecture diagram, a system description, and assumptions about a system under review. You have access to an organizational knowledge base containing documents such as compliance requirements, security policies, business impact assessments, data classification standards, prior security findings, and technology-specific risk guidance.
@@ -454,14 +493,16 @@ def create_space_context_system_prompt() -> SystemMessage:
     </execution>
     """
 
-    if MODEL_PROVIDER == "bedrock":
-        content = [
-            {"type": "text", "text": prompt},
-            {"cachePoint": {"type": "default"}},
-        ]
-        return SystemMessage(content=content)
-    else:
-        return SystemMessage(content=prompt)
+_SPACE_CONTEXT_AGENT_CONTENT = _content_from_parts([_SPACE_CONTEXT_AGENT_PROMPT])
+
+
+def create_space_context_system_prompt() -> SystemMessage:
+    """Create system prompt for the space context knowledge base agent.
+
+    Returns:
+        SystemMessage with complete space context agent instructions
+    """
+    return SystemMessage(content=_SPACE_CONTEXT_AGENT_CONTENT)
 
 
 def structure_prompt(data) -> str:
@@ -473,23 +514,35 @@ def structure_prompt(data) -> str:
      """
 
 
-def create_flows_agent_system_prompt(
-    instructions: str = None, application_type: str = "hybrid"
-) -> SystemMessage:
-    """Create system prompt for the flows definition agent.
+@functools.lru_cache(maxsize=16)
+def _agent_system_content(
+    agent_prompt: str, instructions: str = None, application_type: str = "hybrid"
+):
+    """Build agent system prompt content, memoized per agent prompt and inputs.
 
-    Args:
-        instructions: Optional additional instructions to append to the system prompt
-        application_type: The application type (internal, public_facing, hybrid) for calibration context
-
-    Returns:
-        SystemMessage with complete flows agent instructions
+    Only the content is cached: callers wrap it in a fresh SystemMessage because
+    LangGraph assigns message ids in place.
     """
-
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
 
-    prompt = """
+    parts = [
+        agent_prompt,
+        f"<application_context>\n{app_type_context}\n</application_context>\n\n",
+        f"<asset_criticality>\n{_ASSET_CRITICALITY_CONTEXT}\n</asset_criticality>",
+    ]
+    if instructions:
+        parts.append(
+            "\n\n<additional_instructions>\n"
+            f"{_normalize_instructions(instructions)}"
+            "\n</additional_instructions>"
+        )
+
+    # The agent reuses this system message for the whole conversation, so the
+    # instructions are part of the cached prefix (Bedrock only).
+    return _content_from_parts(parts)
+
+
+_FLOWS_AGENT_PROMPT = """
     <role>
 You are a security architect building a FlowsList — data flows, trust
 boundaries, and threat sources — that downstream threat modeling agents use
@@ -566,35 +619,27 @@ finishing.
 </workflow>
     """
 
-    prompt += (
-        f"<application_context>\n{app_type_context}\n</application_context>\n\n"
-        f"<asset_criticality>\n{criticality_context}\n</asset_criticality>"
-    )
 
-    if instructions:
-        prompt += (
-            f"\n\n<additional_instructions>\n{instructions}\n</additional_instructions>"
-        )
+def create_flows_agent_system_prompt(
+    instructions: str = None, application_type: str = "hybrid"
+) -> SystemMessage:
+    """Create system prompt for the flows definition agent.
 
-    # Build content with conditional cache points (Bedrock only)
-    if MODEL_PROVIDER == "bedrock":
-        content = [
-            {"type": "text", "text": prompt},
-            {"cachePoint": {"type": "default"}},
-        ]
-        return SystemMessage(content=content)
-    else:
-        return SystemMessage(content=prompt)
+    Args:
+        instructions: Optional additional instructions to append to the system prompt
+        application_type: The application type (internal, public_facing, hybrid) for calibration context
 
+    Returns:
+        SystemMessage with complete flows agent instructions
+    """
+    return SystemMessage(
+        content=_agent_system_content(
+            _FLOWS_AGENT_PROMPT, instructions, application_type
+        )
+    )
 
-def create_threats_agent_system_prompt(
-    instructions: str = None, application_type: str = "hybrid"
-) -> SystemMessage:
-    """Create system prompt for the single threats agent."""
-    app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
 
-    prompt = """
+_THREATS_AGENT_PROMPT = """
 <role>
 You are a security architect performing threat modeling for a system
 architecture. You build a comprehensive threat catalog using the STRIDE
@@ -708,24 +753,16 @@ gap_analysis explicitly flags them.
 </workflow>
     """
 
-    prompt += (
-        f"<application_context>\n{app_type_context}\n</application_context>\n\n"
-        f"<asset_criticality>\n{criticality_context}\n</asset_criticality>"
-    )
 
-    if instructions:
-        prompt += (
-            f"\n\n<additional_instructions>\n{instructions}\n</additional_instructions>"
+def create_threats_agent_system_prompt(
+    instructions: str = None, application_type: str = "hybrid"
+) -> SystemMessage:
+    """Create system prompt for the single threats agent."""
+    return SystemMessage(
+        content=_agent_system_content(
+            _THREATS_AGENT_PROMPT, instructions, application_type
         )
-
-    if MODEL_PROVIDER == "bedrock":
-        content = [
-            {"type": "text", "text": prompt},
-            {"cachePoint": {"type": "default"}},
-        ]
-        return SystemMessage(content=content)
-    else:
-        return SystemMessage(content=prompt)
+    )
 
 
 def version_diff_prompt() -> str:
@@ -742,10 +779,7 @@ After describing the changes, assess whether this is suitable for an incremental
 Set `proceed` to false ONLY when the architectures are fundamentally different systems with little structural overlap — for example, a completely different application, a total platform rewrite, or diagrams that share almost no components. Most architecture updates (adding services, changing providers, restructuring modules, scaling tiers) are suitable for versioning even if extensive."""
 
 
-def create_version_agent_system_prompt() -> SystemMessage:
-    """Create system prompt for the version agent that updates threat models to reflect architecture changes."""
-
-    prompt = """<role>
+_VERSION_AGENT_PROMPT = """<role>
 You are a security architect versioning an existing threat model to reflect architecture changes. You have the current threat model state and a summary of what changed.
 </role>
 
@@ -808,11 +842,9 @@ Apply STRIDE with these calibration principles:
 </quality_standards>
 """
 
-    if MODEL_PROVIDER == "bedrock":
-        content = [
-            {"type": "text", "text": prompt},
-            {"cachePoint": {"type": "default"}},
-        ]
-        return SystemMessage(content=content)
-    else:
-        return SystemMessage(content=prompt)
+_VERSION_AGENT_CONTENT = _content_from_parts([_VERSION_AGENT_PROMPT])
+
+
+def create_version_agent_system_prompt() -> SystemMessage:
+    """Create system prompt for the version agent that updates threat models to reflect architecture changes."""
+    return SystemMessage(content=_VERSION_AGENT_CONTENT)
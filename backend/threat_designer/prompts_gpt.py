@@ -13,16 +13,10 @@ This version is optimized for OpenAI GPT 5.2's instruction-following characteris
 stronger adherence, lower drift, conservative grounding bias, and native tool parallelism.
 """
 
-import os
+import functools
 from langchain_core.messages import SystemMessage
 
-# Import model provider from config
-try:
-    from config import config
-
-    MODEL_PROVIDER = config.model_provider
-except ImportError:
-    MODEL_PROVIDER = os.environ.get("MODEL_PROVIDER", "openai")
+from message_builder import _normalize_instructions
 
 
 APPLICATION_TYPE_DESCRIPTIONS = {
@@ -47,17 +41,29 @@ APPLICATION_TYPE_DESCRIPTIONS = {
 }
 
 
+# Fallback for unknown application types; fails at import if "hybrid" is missing.
+_HYBRID_DESCRIPTION = APPLICATION_TYPE_DESCRIPTIONS["hybrid"]
+
+
 def _get_application_type_context(application_type: str = "hybrid") -> str:
     """Return an XML-wrapped application type context block for injection into prompts."""
-    description = APPLICATION_TYPE_DESCRIPTIONS.get(
-        application_type, APPLICATION_TYPE_DESCRIPTIONS["hybrid"]
-    )
+    description = APPLICATION_TYPE_DESCRIPTIONS.get(application_type)
+    if description is None:
+        description = _HYBRID_DESCRIPTION
     return f"\n<application_type>\nApplication Type: {application_type}\n{description}\n</application_type>\n"
 
 
-def _get_asset_criticality_context() -> str:
-    """Return an XML-wrapped asset criticality definitions block for injection into prompts."""
-    return """
+def _get_instructions_context(instructions: str) -> str:
+    """Return an XML-wrapped block carrying user-supplied instructions."""
+    return (
+        "\n<important_instructions>\n"
+        f"{_normalize_instructions(instructions)}"
+        "\n</important_instructions>\n"
+    )
+
+
+# XML-wrapped asset criticality definitions block for injection into prompts.
+_ASSET_CRITICALITY_CONTEXT = """
 <asset_criticality>
 Assets and entities have a criticality level that reflects their risk profile:
 
@@ -74,12 +80,13 @@ For Entities (users, roles, external systems, services) — based on privilege l
 """
 
 
-def summary_prompt() -> str:
+def summary_prompt() -> list:
     main_prompt = """You are a concise summarizer. Given the user-provided information, produce a single headline summary of max {SUMMARY_MAX_WORDS_DEFAULT} words. Output only the summary — no preamble, no explanation."""
     return [{"type": "text", "text": main_prompt}]
 
 
-def asset_prompt(application_type: str = "hybrid") -> str:
+@functools.lru_cache(maxsize=32)
+def asset_prompt(application_type: str = "hybrid") -> list:
     app_type_context = _get_application_type_context(application_type)
     main_prompt = """You are a security architect specializing in threat modeling. Your task is to identify critical assets and entities within a system architecture, producing a structured inventory for downstream threat analysis.
 
@@ -134,12 +141,12 @@ Before finalizing, re-scan:
 - Criticality assignments are consistent with the criteria above.
 </high_risk_self_check>
 """
-    return [{"type": "text", "text": app_type_context + main_prompt}]
+    return [{"type": "text", "text": "".join((main_prompt, app_type_context))}]
 
 
-def gap_prompt(instructions: str = None, application_type: str = "hybrid") -> str:
+@functools.lru_cache(maxsize=32)
+def gap_prompt(instructions: str = None, application_type: str = "hybrid") -> list:
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
     main_prompt = """# Role
 
 You audit threat catalogs against a specific architecture and decide **STOP** (catalog is production-ready) or **CONTINUE** (gaps remain). A CONTINUE sends the generating agent back, so your findings must be specific enough to act on. This prompt may be called multiple times — each iteration evaluates whether previous gaps were addressed and whether new ones emerged.
@@ -228,24 +235,28 @@ Focus gaps on the highest-value findings. Do not list more than 10 gaps. Every g
 """
 
     if instructions:
-        instructions_prompt = f"""\n<important_instructions>
-         {instructions}
-         </important_instructions>
-      """
-        final_prompt = (
-            instructions_prompt + app_type_context + criticality_context + main_prompt
+        instructions_prompt = _get_instructions_context(instructions)
+        final_prompt = "".join(
+            (
+                main_prompt,
+                _ASSET_CRITICALITY_CONTEXT,
+                app_type_context,
+                instructions_prompt,
+            )
         )
     else:
-        final_prompt = app_type_context + criticality_context + main_prompt
+        final_prompt = "".join(
+            (main_prompt, _ASSET_CRITICALITY_CONTEXT, app_type_context)
+        )
 
     return [{"type": "text", "text": final_prompt}]
 
 
+@functools.lru_cache(maxsize=32)
 def threats_improve_prompt(
     instructions: str = None, application_type: str = "hybrid"
-) -> str:
+) -> list:
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
     main_prompt = """You are a security architect generating STRIDE threat entries for a system architecture. You produce structured JSON threat objects for a threat catalog. Precision in field values and realistic severity calibration are paramount.
 
 <design_and_scope_constraints>
@@ -337,26 +348,32 @@ Before finalizing, re-scan:
 """
 
     if instructions:
-        instructions_prompt = f"""\n<important_instructions>
-         {instructions}
-         </important_instructions>
-      """
+        instructions_prompt = _get_instructions_context(instructions)
         return [
             {
                 "type": "text",
-                "text": instructions_prompt
-                + app_type_context
-                + criticality_context
-                + main_prompt,
+                "text": "".join(
+                    (
+                        main_prompt,
+                        _ASSET_CRITICALITY_CONTEXT,
+                        app_type_context,
+                        instructions_prompt,
+                    )
+                ),
             }
         ]
     return [
-        {"type": "text", "text": app_type_context + criticality_context + main_prompt}
+        {
+            "type": "text",
+            "text": "".join(
+                (main_prompt, _ASSET_CRITICALITY_CONTEXT, app_type_context)
+            ),
+        }
     ]
 
 
-def threats_prompt(instructions: str = None, application_type: str = "hybrid") -> str:
-    return threats_improve_prompt(instructions, application_type)
+# Initial threat generation uses the same prompt as the improvement pass.
+threats_prompt = threats_improve_prompt
 
 
 def create_space_context_system_prompt() -> SystemMessage:
@@ -462,7 +479,6 @@ def create_flows_agent_system_prompt(
     """
 
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
 
     prompt = """
     # Role
@@ -586,18 +602,20 @@ Before considering the FlowsList complete:
 4. Verify no flows or boundaries reference components you inferred but that are not explicitly present in the inputs.
     """
 
-    prompt += (
-        f"<application_context>\n{app_type_context}\n</application_context>\n\n"
-        f"<asset_criticality>\n{criticality_context}\n</asset_criticality>"
-    )
-
+    parts = [
+        prompt,
+        f"<application_context>\n{app_type_context}\n</application_context>\n\n",
+        f"<asset_criticality>\n{_ASSET_CRITICALITY_CONTEXT}\n</asset_criticality>",
+    ]
     if instructions:
-        prompt += (
-            f"\n\n<additional_instructions>\n{instructions}\n</additional_instructions>"
+        parts.append(
+            "\n\n<additional_instructions>\n"
+            f"{_normalize_instructions(instructions)}"
+            "\n</additional_instructions>"
         )
 
     # GPT 5.2: caching is handled automatically by OpenAI — no manual cache points needed
-    return SystemMessage(content=prompt)
+    return SystemMessage(content="".join(parts))
 
 
 def create_threats_agent_system_prompt(
@@ -605,7 +623,6 @@ def create_threats_agent_system_prompt(
 ) -> SystemMessage:
     """Create system prompt for the single threats agent."""
     app_type_context = _get_application_type_context(application_type)
-    criticality_context = _get_asset_criticality_context()
 
     prompt = f"""# Role
 
@@ -729,11 +746,13 @@ Before outputting `THREAT_CATALOG_COMPLETE`, verify:
 4. All `target` and `source` values exactly match the tool schema enums.
 
 {app_type_context}
-{criticality_context}
+{_ASSET_CRITICALITY_CONTEXT}
 """
 
     if instructions:
-        prompt += f"\nAdditional instructions:\n{instructions}\n"
+        prompt += (
+            f"\nAdditional instructions:\n{_normalize_instructions(instructions)}\n"
+        )
 
     return SystemMessage(content=prompt)
 
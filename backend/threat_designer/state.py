@@ -4,6 +4,7 @@ import functools
 import operator
 from datetime import datetime
 from langgraph.graph import MessagesState
+from langgraph.types import Overwrite
 from typing import Annotated, List, Literal, Optional, TypedDict
 
 from constants import (
@@ -16,6 +17,10 @@ from constants import (
 from langchain_aws import ChatBedrockConverse
 from pydantic import BaseModel, Field
 
+# Field types shared by several models, built once at import.
+_STRIDE_VALUES = tuple(category.value for category in StrideCategory)
+_STRIDE_CATEGORY = Literal[_STRIDE_VALUES]
+_LEVEL = Literal["Low", "Medium", "High"]
 
 
 class ImageMetadata(BaseModel):
@@ -121,7 +126,7 @@ class Assets(BaseModel):
         str, Field(description="The description of the asset or entity")
     ]
     criticality: Annotated[
-        Literal["Low", "Medium", "High"],
+        _LEVEL,
         Field(description="Criticality level of the asset", default="Medium"),
     ] = "Medium"
 
@@ -168,7 +173,7 @@ class GapFinding(BaseModel):
         ),
     ]
     stride_category: Annotated[
-        Literal[*[category.value for category in StrideCategory]],
+        _STRIDE_CATEGORY,
         Field(
             description="The STRIDE category that is missing or underrepresented for this target."
         ),
@@ -269,9 +274,9 @@ class Threat(BaseModel):
         ),
     ]
     stride_category: Annotated[
-        Literal[*[category.value for category in StrideCategory]],
+        _STRIDE_CATEGORY,
         Field(
-            description=f"The STRIDE category classification: One of {', '.join([category.value for category in StrideCategory])}."
+            description=f"The STRIDE category classification: One of {', '.join(_STRIDE_VALUES)}."
         ),
     ]
     description: Annotated[
@@ -294,7 +299,7 @@ class Threat(BaseModel):
         ),
     ]
     likelihood: Annotated[
-        Literal["Low", "Medium", "High"],
+        _LEVEL,
         Field(
             description="The probability of threat occurrence based on factors like attacker motivation, capability, opportunity, and existing controls"
         ),
@@ -351,15 +356,20 @@ class ThreatsList(BaseModel):
         new_threats = [
             threat for threat in other.threats if threat.name not in existing_names
         ]
-        combined_threats = self.threats + new_threats
-        return ThreatsList(threats=combined_threats)
+        # Both lists hold already-validated Threat instances, so skip re-validation.
+        return ThreatsList.model_construct(threats=self.threats + new_threats)
 
     def remove(self, threat_name: str) -> "ThreatsList":
         """Remove a threat by name and return a new ThreatsList instance."""
+        return self.remove_many((threat_name,))
+
+    def remove_many(self, threat_names) -> "ThreatsList":
+        """Remove all named threats in one pass and return a new ThreatsList."""
+        names = set(threat_names)
         filtered_threats = [
-            threat for threat in self.threats if threat.name != threat_name
+            threat for threat in self.threats if threat.name not in names
         ]
-        return ThreatsList(threats=filtered_threats)
+        return ThreatsList.model_construct(threats=filtered_threats)
 
 
 @functools.lru_cache(maxsize=16)
@@ -461,8 +471,6 @@ def _add_or_overwrite(left, right):
 
     Tools send deltas (+1, +2) for increments, or Overwrite(value) for resets.
     """
-    from langgraph.types import Overwrite
-
     # If right is Overwrite, use its value (explicit replacement like reset to 0)
     if isinstance(right, Overwrite):
         return right.value
@@ -475,8 +483,6 @@ def _add_or_overwrite(left, right):
 
 def _overwrite_or_last(left, right):
     """Reducer for boolean flags that respects Overwrite."""
-    from langgraph.types import Overwrite
-
     if isinstance(right, Overwrite):
         return right.value
     if isinstance(left, Overwrite):
@@ -513,8 +519,6 @@ def _merge_flows_list(left, right):
     Tools send deltas (FlowsList with partial lists) for additions,
     or Overwrite(FlowsList) for replacements (e.g., after deletions).
     """
-    from langgraph.types import Overwrite
-
     if isinstance(right, Overwrite):
         return right.value
     if isinstance(left, Overwrite):
@@ -2,6 +2,9 @@ from langchain.tools import tool, ToolRuntime
 from langchain_core.messages import ToolMessage
 from langchain_core.messages import SystemMessage
 from state import (
+    Assets,
+    DataFlow,
+    Threat,
     ThreatsList,
     ContinueThreatModeling,
     DataFlowsList,
@@ -24,13 +27,20 @@ from constants import (
 from monitoring import logger
 from config import config as app_config
 from state_tracking_service import StateService
-from pydantic import BaseModel
-import json
+from pydantic import BaseModel, TypeAdapter
+import functools
 from collections import Counter
 
 # Initialize state service for status updates
 state_service = StateService(app_config.agent_state_table)
 
+# Serializers for the catalog dumps sent to the model. dump_json writes JSON
+# directly in pydantic-core, skipping the model_dump() dicts json.dumps needs.
+_THREATS_ADAPTER = TypeAdapter(List[Threat])
+_ASSETS_ADAPTER = TypeAdapter(List[Assets])
+_DATA_FLOWS_ADAPTER = TypeAdapter(List[DataFlow])
+_EXCLUDE_THREAT_NOTES = {"__all__": {"notes"}}
+
 
 # ============================================================================
 # Shared Validation Helpers
@@ -565,6 +575,7 @@ def add_threats(threats: ThreatsList, runtime: ToolRuntime):
     return _handle_add_threats(threats, runtime)
 
 
+@functools.lru_cache(maxsize=16)
 def create_dynamic_add_threats_tool(
     threats_list_model: type[BaseModel],
     max_uses: int = MAX_ADD_THREATS_USES,
@@ -578,6 +589,11 @@ def create_dynamic_add_threats_tool(
     that the JSON schema presented to the LLM includes ``enum`` constraints for
     the ``target`` and ``source`` fields.
 
+    Tools are cached per model and limits. The threats agent rebuilds its tool
+    list on every turn, and the models come from the cached
+    ``create_constrained_threat_model``, so each turn reuses the same tool and
+    its generated input schema.
+
     Args:
         threats_list_model: Dynamic ThreatsList with Literal-constrained fields.
         max_uses: Maximum add_threats calls before requiring gap_analysis.
@@ -626,10 +642,8 @@ def remove_threat(
         detail=f"{threat_count} threats deleted from catalog",
     )
 
-    # Apply remove method for each threat name
-    updated_threat_list = current_threat_list
-    for threat_name in threats:
-        updated_threat_list = updated_threat_list.remove(threat_name)
+    # Drop all named threats in one pass over the catalog
+    updated_threat_list = current_threat_list.remove_many(threats)
 
     return Command(
         update={
@@ -669,24 +683,24 @@ def read_threat_catalog(
         return "No threats found in the catalog."
 
     # Format the output
-    output = f"Total threats: {len(current_threat_list.threats)}\n\n"
+    parts = [f"Total threats: {len(current_threat_list.threats)}\n\n"]
 
     if verbose:
-        output += json.dumps(
-            [
-                threat.model_dump(exclude={"notes"})
-                for threat in current_threat_list.threats
-            ],
-            indent=2,
+        parts.append(
+            _THREATS_ADAPTER.dump_json(
+                current_threat_list.threats, indent=2, exclude=_EXCLUDE_THREAT_NOTES
+            ).decode()
         )
     else:
         for i, threat in enumerate(current_threat_list.threats, 1):
-            output += f"{i}. {threat.name}\n"
-            output += f"   Likelihood: {threat.likelihood}\n"
-            output += f"   Stride category: {threat.stride_category}\n"
-            output += "\n"
+            parts.append(
+                f"{i}. {threat.name}\n"
+                f"   Likelihood: {threat.likelihood}\n"
+                f"   Stride category: {threat.stride_category}\n"
+                "\n"
+            )
 
-    return output
+    return "".join(parts)
 
 
 @tool(
@@ -755,16 +769,18 @@ def catalog_stats(
 def gap_analysis(runtime: ToolRuntime) -> str:
     """Perform gap analysis on the current threat catalog."""
 
+    state = runtime.state
+
     # Get current gap_tool_use counter (unwrap Overwrite if present)
-    gap_tool_use = unwrap_overwrite(runtime.state.get("gap_tool_use", 0), 0)
-    tool_use = unwrap_overwrite(runtime.state.get("tool_use", 0), 0)
-    job_id = runtime.state.get("job_id", "unknown")
+    gap_tool_use = unwrap_overwrite(state.get("gap_tool_use", 0), 0)
+    tool_use = unwrap_overwrite(state.get("tool_use", 0), 0)
+    job_id = state.get("job_id", "unknown")
 
     min_threats = MIN_GAP_THRESHOLD
     max_gap = MAX_GAP_ANALYSIS_USES
 
     # Check if threat catalog has enough threats
-    threat_list = runtime.state.get("threat_list")
+    threat_list = state.get("threat_list")
     threat_count = (
         len(threat_list.threats) if threat_list and threat_list.threats else 0
     )
@@ -816,9 +832,6 @@ def gap_analysis(runtime: ToolRuntime) -> str:
         job_id, JobState.THREAT.value, detail="Reviewing for gaps"
     )
 
-    # Get current state
-    state = runtime.state
-
     # Prepare gap analysis messages using MessageBuilder
     msg_builder = MessageBuilder(
         state.get("image_data"),
@@ -829,13 +842,11 @@ def gap_analysis(runtime: ToolRuntime) -> str:
     )
 
     # Convert threat_list to string for message
-    threat_list = state.get("threat_list")
     threat_list_str = ""
     if threat_list and threat_list.threats:
-        threat_list_str = json.dumps(
-            [threat.model_dump(exclude={"notes"}) for threat in threat_list.threats],
-            indent=2,
-        )
+        threat_list_str = _THREATS_ADAPTER.dump_json(
+            threat_list.threats, indent=2, exclude=_EXCLUDE_THREAT_NOTES
+        ).decode()
 
     # Fresh run each time — no previous gaps passed
     gap_str = ""
@@ -857,14 +868,9 @@ def gap_analysis(runtime: ToolRuntime) -> str:
 
     # Create gap analysis message (with threat sources, without KPIs — gap analysis focuses on semantic coverage)
     human_message = msg_builder.create_gap_analysis_message(
-        json.dumps([asset.model_dump() for asset in all_assets], indent=2)
-        if all_assets
-        else "",
-        json.dumps(
-            [flow.model_dump() for flow in state.get("system_architecture").data_flows],
-            indent=2,
-        )
-        if state.get("system_architecture")
+        _ASSETS_ADAPTER.dump_json(all_assets, indent=2).decode() if all_assets else "",
+        _DATA_FLOWS_ADAPTER.dump_json(system_architecture.data_flows, indent=2).decode()
+        if system_architecture
         else "",
         threat_list_str,
         gap_str,
@@ -873,9 +879,10 @@ def gap_analysis(runtime: ToolRuntime) -> str:
 
     # Create system prompt (without threat sources)
     app_type = state.get("application_type", "hybrid")
-    if state.get("instructions"):
+    instructions = state.get("instructions")
+    if instructions:
         system_prompt = SystemMessage(
-            content=gap_prompt(state.get("instructions"), application_type=app_type)
+            content=gap_prompt(instructions, application_type=app_type)
         )
     else:
         system_prompt = SystemMessage(content=gap_prompt(application_type=app_type))